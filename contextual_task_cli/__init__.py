@@ -24,14 +24,49 @@ Programmatic Usage:
     plan = manager.generate_plan()
 """
 
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
 __version__ = "0.1.0"
 __author__ = "Your Name"
 
 # Re-export key classes for programmatic use
 # This allows: from contextual_task_cli import TaskPlan
-from .conversation import ConversationManager
-from .formatters import format_as_json, format_as_markdown
-from .models import Priority, Task, TaskPlan
+#
+# LEARNING NOTE:
+# The re-exports are "lazy" (PEP 562): the submodule is only imported the
+# first time one of these names is accessed. Importing the package itself
+# (which every CLI command does) then doesn't pull in anthropic/pydantic.
+_LAZY_EXPORTS = {
+    "ConversationManager": ".conversation",
+    "format_as_json": ".formatters",
+    "format_as_markdown": ".formatters",
+    "format_as_markdown_stream": ".formatters",
+    "Priority": ".models",
+    "Task": ".models",
+    "TaskPlan": ".models",
+}
+
+if TYPE_CHECKING:
+    # Type checkers and IDEs see normal imports
+    from .conversation import ConversationManager
+    from .formatters import (
+        format_as_json,
+        format_as_markdown,
+        format_as_markdown_stream,
+    )
+    from .models import Priority, Task, TaskPlan
+
+
+def __getattr__(name: str) -> Any:
+    """Import a re-exported name from its submodule on first access."""
+    if name not in _LAZY_EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(import_module(_LAZY_EXPORTS[name], __name__), name)
+    globals()[name] = value  # Cache so __getattr__ isn't called again
+    return value
+
 
 __all__ = [
     # Version info
@@ -46,4 +81,5 @@ __all__ = [
     # Formatters
     "format_as_json",
     "format_as_markdown",
+    "format_as_markdown_stream",
 ]
@@ -17,6 +17,8 @@ Environment variables are loaded in this priority order:
 3. Default values defined in the Settings class
 """
 
+from functools import lru_cache
+
 from pydantic import Field, SecretStr
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -63,6 +65,22 @@ class Settings(BaseSettings):
         description="Maximum number of clarifying questions to ask"
     )
 
+    # === Network Configuration ===
+    max_retries: int = Field(
+        default=3,
+        ge=0,
+        le=10,
+        description="Times to retry an API call on connection errors, "
+                    "rate limits, or server errors (with exponential backoff)"
+    )
+
+    stream_timeout: float = Field(
+        default=30.0,
+        gt=0,
+        description="Seconds to wait for more data from a streaming "
+                    "response before giving up on it"
+    )
+
     # === Pydantic Settings Configuration ===
     model_config = SettingsConfigDict(
         # Load from .env file if it exists
@@ -84,13 +102,13 @@ class Settings(BaseSettings):
 # ============================================================================
 # Singleton Pattern for Settings
 # ============================================================================
-# We use a module-level variable to cache the Settings instance.
+# We use functools.lru_cache to cache the Settings instance.
 # This avoids re-reading the .env file on every call to get_settings().
-# This is a simple form of the "singleton" pattern.
-
-_settings: Settings | None = None
+# With maxsize=1 and no arguments, the cache holds exactly one instance -
+# a simple form of the "singleton" pattern.
 
 
+@lru_cache(maxsize=1)
 def get_settings() -> Settings:
     """
     Get application settings (lazy-loaded singleton).
@@ -98,6 +116,8 @@ def get_settings() -> Settings:
     LEARNING NOTE:
     This function uses "lazy loading" - it only creates the Settings
     object when first called, then returns the cached version.
+    The @lru_cache decorator does the caching for us: the first call
+    runs the function body, every later call returns the stored result.
 
     Why? Two reasons:
     1. Performance: Reading .env file once is faster than every time
@@ -109,12 +129,7 @@ def get_settings() -> Settings:
     Raises:
         ValidationError: If required settings (like API key) are missing
     """
-    global _settings
-
-    if _settings is None:
-        _settings = Settings()
-
-    return _settings
+    return Settings()
 
 
 def reset_settings() -> None:
@@ -125,5 +140,4 @@ def reset_settings() -> None:
     In tests, you often want to change settings between test cases.
     This function clears the cache so get_settings() creates a fresh instance.
     """
-    global _settings
-    _settings = None
+    get_settings.cache_clear()
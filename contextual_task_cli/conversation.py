@@ -21,20 +21,101 @@ The conversation flow:
 5. Generate and return the task plan
 """
 
+import asyncio
+import contextlib
+import io
 import json
-
-from anthropic import Anthropic
+import re
+import time
+from collections.abc import Callable
+from functools import cached_property, lru_cache
+from typing import TYPE_CHECKING, Any
+
+import httpx2
+from anthropic import (
+    Anthropic,
+    APIConnectionError,
+    APIError,
+    APITimeoutError,
+    AsyncAnthropic,
+    DefaultAsyncHttpxClient,
+    DefaultHttpxClient,
+    Timeout,
+)
+from pydantic import ValidationError
+
+# LEARNING NOTE:
+# orjson is an optional, much faster JSON parser written in Rust.
+# If it isn't installed (pip install -e ".[fast]"), we fall back to the
+# standard library. Both raise json.JSONDecodeError subclasses on bad input,
+# so the error handling below works the same either way.
+# The annotation gives both imports one signature, so type checkers accept
+# either function under the same name.
+json_loads: Callable[[str | bytes], Any]
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
 
 from .config import get_settings
-from .models import (
-    ClarifyingQuestion,
-    ConversationMessage,
-    Priority,
-    Task,
-    TaskPlan,
-)
+from .models import ClarifyingQuestion, Priority, TaskPlan
 from .prompts import get_plan_generation_prompt, get_system_prompt
 
+if TYPE_CHECKING:
+    # Only imported for type hints - never at runtime
+    from anthropic.types.message_create_params import (
+        MessageCreateParamsNonStreaming,
+    )
+    from anthropic.types.messages import MessageBatch, batch_create_params
+
+# Matches the first markdown code block, with or without a "json" tag:
+#     ```json\n{...}\n```   or   ```\n{...}\n```
+# Compiled once at import time so each response is scanned in a single pass.
+# re.DOTALL lets "." match newlines, since the JSON spans multiple lines.
+_JSON_FENCE_RE = re.compile(r"```(?:json)?\s*\n?(.*?)```", re.DOTALL)
+
+# Maps priority strings from Claude ("high") to the Priority enum.
+# A dict lookup with a default is cheaper than raising/catching ValueError.
+_PRIORITY_BY_NAME: dict[str, Priority] = {p.value: p for p in Priority}
+
+# Connection pool limits for our HTTP clients.
+# They're built with httpx2, the HTTP library the Anthropic SDK's clients
+# (DefaultHttpxClient and friends) are built on.
+# It closes idle connections after 5 seconds by default - shorter than
+# it takes a person to answer a question, so every turn would pay for a
+# new TCP + TLS handshake. Keeping idle connections for 2 minutes lets
+# the next turn reuse the one the previous turn opened. A CLI session
+# only ever needs a few connections, so the pool stays small.
+_HTTP_LIMITS = httpx2.Limits(
+    max_connections=100, max_keepalive_connections=4, keepalive_expiry=120.0
+)
+
+
+@lru_cache(maxsize=1)
+def _get_anthropic_client(api_key: str, max_retries: int) -> Anthropic:
+    """
+    Get a shared Anthropic client for the given API key.
+
+    LEARNING NOTE:
+    Each client owns an HTTP connection pool. Sharing one client between
+    ConversationManager instances lets them reuse open connections instead
+    of doing a new TCP + TLS handshake each time. The arguments are the
+    cache key, so changing them (e.g. after reset_settings()) creates a
+    new client.
+
+    max_retries makes the SDK retry connection errors, rate limits and
+    server errors with exponential backoff - so a network blip doesn't
+    throw away the whole conversation.
+
+    DefaultHttpxClient keeps the SDK's own defaults (timeouts, proxies,
+    TCP keepalive) and only overrides the pool limits.
+    """
+    return Anthropic(
+        api_key=api_key,
+        max_retries=max_retries,
+        http_client=DefaultHttpxClient(limits=_HTTP_LIMITS),
+    )
+
 
 class ConversationError(Exception):
     """
@@ -78,29 +159,103 @@ class ConversationManager:
         plan = manager.generate_plan()
     """
 
-    def __init__(self) -> None:
+    def __init__(self, max_questions: int | None = None) -> None:
         """
         Initialize the conversation manager.
 
         LEARNING NOTE:
         We get settings here so any configuration errors fail early.
-        The Anthropic client is created with our API key.
+        The Anthropic client is looked up (or created) with our API key.
+
+        Args:
+            max_questions: Override for settings.max_questions (e.g. from
+                the --max-questions CLI flag). None uses the setting.
         """
         self.settings = get_settings()
+        self.max_questions = (
+            max_questions if max_questions is not None
+            else self.settings.max_questions
+        )
 
         # Create the Anthropic API client
         # SecretStr.get_secret_value() returns the actual string
-        self.client = Anthropic(
-            api_key=self.settings.anthropic_api_key.get_secret_value()
+        api_key = self.settings.anthropic_api_key.get_secret_value()
+        self.client = _get_anthropic_client(api_key, self.settings.max_retries)
+        # (self.async_client is created on first use - see below)
+
+        # Timeout for streamed responses. "read" is the longest we wait
+        # between chunks - if Claude's stream stalls, we give up after that
+        # instead of hanging forever. The other limits match the SDK:
+        # 5s to connect, 600s for writes and for getting a pooled
+        # connection. There is no limit on the stream's total duration.
+        self._stream_timeout = Timeout(
+            600.0, connect=5.0, read=self.settings.stream_timeout
         )
 
+        # The system prompt only depends on max_questions, which is fixed
+        # for this manager - so render it once, not every turn.
+        #
+        # LEARNING NOTE:
+        # cache_control marks a "prompt caching" breakpoint. Because the
+        # system prompt is identical on every turn, Anthropic can reuse
+        # its processed form instead of re-reading (and re-billing) it.
+        self._system_prompt: list[dict[str, Any]] = [{
+            "type": "text",
+            "text": get_system_prompt(self.max_questions),
+            "cache_control": {"type": "ephemeral"},
+        }]
+
         # Conversation state
-        self.messages: list[ConversationMessage] = []
+        # Messages are stored in the exact format the Anthropic API expects:
+        # [{"role": "user", "content": "..."}, ...]
+        # so they can be sent as-is without rebuilding the list every turn.
+        self.messages: list[dict[str, str]] = []
         self.original_request: str = ""
         self.questions_asked: int = 0
         self.is_ready: bool = False
         self.understanding_summary: str = ""
 
+        # Plan text generated ahead of time by answer_async(speculate=True)
+        self._speculative_plan_json: str | None = None
+
+        # Cache of the last rendered plan generation prompt
+        self._last_plan_prompt_key: tuple[str, str] | None = None
+        self._last_plan_prompt: str = ""
+
+    @cached_property
+    def async_client(self) -> AsyncAnthropic:
+        """
+        The async Anthropic client, created the first time it's needed.
+
+        It's used by start_async()/answer_async() so programmatic callers
+        can run several conversations concurrently. It isn't shared like
+        self.client: async connections belong to the event loop they were
+        opened on.
+
+        LEARNING NOTE:
+        @cached_property runs this method once, on first access, and
+        stores the result on the instance. Building a client (with its
+        own connection pool and SSL context) takes ~20ms, which the sync
+        `plan` path and plan-batch never need to pay.
+        """
+        return AsyncAnthropic(
+            api_key=self.settings.anthropic_api_key.get_secret_value(),
+            max_retries=self.settings.max_retries,
+            http_client=DefaultAsyncHttpxClient(limits=_HTTP_LIMITS),
+        )
+
+    async def aclose(self) -> None:
+        """
+        Close the async client's connections, if it was ever created.
+
+        Call this on the same event loop the async methods ran on, before
+        closing that loop - its pooled connections belong to it. A later
+        async call simply creates a new client.
+        """
+        async_client = self.__dict__.pop("async_client", None)
+        if async_client is not None:
+            await async_client.close()
+
     def start(self, task_description: str) -> list[ClarifyingQuestion]:
         """
         Start a new conversation with the initial task description.
@@ -113,22 +268,29 @@ class ConversationManager:
         Returns:
             List of clarifying questions from Claude, or empty if ready
         """
-        # Reset state for a new conversation
-        self.original_request = task_description
-        self.messages = []
-        self.questions_asked = 0
-        self.is_ready = False
-        self.understanding_summary = ""
-
-        # Add the user's initial message to history
-        self.messages.append(ConversationMessage(
-            role="user",
-            content=f"I need help planning this task: {task_description}"
-        ))
+        self._reset(task_description)
 
         # Get Claude's response (questions or ready signal)
         return self._get_claude_response()
 
+    async def start_async(self, task_description: str) -> list[ClarifyingQuestion]:
+        """
+        Async version of start() for programmatic/batch callers.
+
+        LEARNING NOTE:
+        While one conversation waits on the network, asyncio can run
+        others. Example:
+            await asyncio.gather(*(m.start_async(t) for m, t in pairs))
+
+        Args:
+            task_description: The user's initial task description
+
+        Returns:
+            List of clarifying questions from Claude, or empty if ready
+        """
+        self._reset(task_description)
+        return await self._get_claude_response_async()
+
     def answer(self, user_response: str) -> list[ClarifyingQuestion]:
         """
         Process the user's answer and get follow-up questions.
@@ -146,15 +308,128 @@ class ConversationManager:
         if self.is_ready:
             return []
 
+        # Question budget already spent - don't pay for another API call
+        if self.questions_asked >= self.max_questions:
+            self.is_ready = True
+            return []
+
         # Add user's response to conversation history
-        self.messages.append(ConversationMessage(
-            role="user",
-            content=user_response
-        ))
+        self.messages.append({"role": "user", "content": user_response})
 
         # Get Claude's next response
         return self._get_claude_response()
 
+    async def answer_async(
+        self, user_response: str, speculate: bool = False
+    ) -> list[ClarifyingQuestion]:
+        """
+        Async version of answer() for programmatic/batch callers.
+
+        LEARNING NOTE:
+        With speculate=True, we also start generating the plan right away,
+        in parallel with Claude's reply - betting that this answer was the
+        last one needed. If Claude says it's ready, the plan is already on
+        its way and generate_plan() reuses it (saving a full round trip).
+        If Claude asks more questions, the plan request is cancelled.
+        The trade-offs: cancelled plan requests still use API tokens, and
+        a speculative plan is built before Claude's reply arrives - so,
+        unlike generate_plan(), its prompt has neither that final reply
+        nor the "ready" summary (self.understanding_summary).
+
+        Args:
+            user_response: The user's answer to previous questions
+            speculate: Start plan generation alongside Claude's reply
+
+        Returns:
+            List of follow-up questions, or empty if ready to plan
+        """
+        if self.is_ready:
+            return []
+
+        if self.questions_asked >= self.max_questions:
+            self.is_ready = True
+            return []
+
+        self.messages.append({"role": "user", "content": user_response})
+
+        if not speculate:
+            return await self._get_claude_response_async()
+
+        # Build the plan request now, from the conversation so far
+        # (without Claude's reply to this answer - see the note above)
+        plan_task = asyncio.create_task(
+            self._stream_text_async(**self._plan_request())
+        )
+
+        try:
+            questions = await self._get_claude_response_async()
+        except BaseException:
+            await self._cancel(plan_task)
+            raise
+
+        if not self.is_ready:
+            # The bet didn't pay off - Claude wants to know more
+            await self._cancel(plan_task)
+            return questions
+
+        try:
+            self._speculative_plan_json = await plan_task
+        except Exception:
+            # The speculative plan is optional - whatever went wrong, this
+            # Q&A turn still succeeded. generate_plan() will just make its
+            # own request (and report any error that persists).
+            self._speculative_plan_json = None
+
+        return questions
+
+    @staticmethod
+    async def _cancel(task: "asyncio.Task[Any]") -> None:
+        """
+        Cancel a background task and wait for it to finish.
+
+        Any error the task already failed with is discarded: we no longer
+        need its result, and it mustn't replace the caller's own outcome.
+        """
+        task.cancel()
+        with contextlib.suppress(asyncio.CancelledError, Exception):
+            await task
+
+    def _reset(self, task_description: str) -> None:
+        """
+        Reset all state and record the initial task description.
+
+        Shared by start() and start_async().
+
+        Args:
+            task_description: The user's initial task description
+        """
+        # Reset state for a new conversation
+        self.original_request = task_description
+        self.messages = []
+        self.questions_asked = 0
+        self.is_ready = False
+        self.understanding_summary = ""
+        self._speculative_plan_json = None
+
+        # Add the user's initial message to history
+        self.messages.append(self._opening_message(task_description))
+
+    @staticmethod
+    def _opening_message(task_description: str) -> dict[str, str]:
+        """
+        Build the first user message of a conversation.
+
+        Args:
+            task_description: The user's initial task description
+
+        Returns:
+            The message, in the format the Anthropic API expects
+        """
+        return {
+            "role": "user",
+            "content": f"I need help planning this task: {task_description}",
+        }
+
     def _get_claude_response(self) -> list[ClarifyingQuestion]:
         """
         Send the conversation to Claude and parse the response.
@@ -166,34 +441,153 @@ class ConversationManager:
         Returns:
             List of clarifying questions, or empty if ready
         """
-        # Convert our message objects to the format Anthropic expects
-        # Anthropic wants: [{"role": "user", "content": "..."}, ...]
-        api_messages = [
-            {"role": m.role, "content": m.content}
-            for m in self.messages
-        ]
+        assistant_message = self._stream_text(**self._question_request())
+        return self._handle_assistant_message(assistant_message)
 
-        # Call the Claude API
-        response = self.client.messages.create(
-            model=self.settings.model_name,
-            max_tokens=self.settings.max_tokens,
-            system=get_system_prompt(self.settings.max_questions),
-            messages=api_messages
+    async def _get_claude_response_async(self) -> list[ClarifyingQuestion]:
+        """
+        Async version of _get_claude_response().
+
+        Returns:
+            List of clarifying questions, or empty if ready
+        """
+        assistant_message = await self._stream_text_async(
+            **self._question_request()
         )
+        return self._handle_assistant_message(assistant_message)
 
-        # Extract the text content from Claude's response
-        # response.content is a list of content blocks; we want the first text
-        assistant_message = response.content[0].text
+    def _question_request(self) -> dict[str, Any]:
+        """
+        Build the API request arguments for a Q&A turn.
 
+        Returns:
+            Keyword arguments for messages.stream()
+        """
+        # self.messages is already in the format Anthropic expects.
+        # The newest message also gets a cache breakpoint: the history only
+        # ever grows at the end, so the next turn can reuse everything up
+        # to here from the cache. Only the last message is copied; older
+        # ones are sent as-is.
+        *history, latest = self.messages
+        cached_latest = {
+            "role": latest["role"],
+            "content": [{
+                "type": "text",
+                "text": latest["content"],
+                "cache_control": {"type": "ephemeral"},
+            }],
+        }
+
+        return {
+            "model": self.settings.model_name,
+            "max_tokens": self.settings.max_tokens,
+            "system": self._system_prompt,
+            "messages": [*history, cached_latest],
+        }
+
+    def _handle_assistant_message(
+        self, assistant_message: str
+    ) -> list[ClarifyingQuestion]:
+        """
+        Record Claude's reply in the history and parse it.
+
+        Args:
+            assistant_message: The full text of Claude's response
+
+        Returns:
+            List of clarifying questions, or empty if ready
+        """
         # Add Claude's response to our conversation history
-        self.messages.append(ConversationMessage(
-            role="assistant",
-            content=assistant_message
-        ))
+        self.messages.append({
+            "role": "assistant",
+            "content": assistant_message
+        })
 
         # Parse the structured JSON response
         return self._parse_response(assistant_message)
 
+    def _stream_text(
+        self,
+        on_text: Callable[[str], None] | None = None,
+        **request: Any,
+    ) -> str:
+        """
+        Send a request to Claude and collect the streamed text response.
+
+        LEARNING NOTE:
+        messages.stream() delivers the response in small chunks as Claude
+        generates it, instead of waiting for the whole response like
+        messages.create() does. We collect the chunks in a StringIO buffer
+        and return the full text once the stream is finished.
+
+        Unlike messages.create(), the SDK can't wrap errors that happen
+        while we're reading the stream - they surface as raw httpx2
+        errors. We convert them to Anthropic's exception types so callers
+        only have to handle one family of errors.
+
+        Args:
+            on_text: Optional callback, called with each chunk as it arrives
+                (used by the CLI to show progress)
+            **request: Arguments for messages.stream() (model, messages, ...)
+
+        Returns:
+            The complete text of Claude's response
+
+        Raises:
+            APITimeoutError: If the stream stalls for longer than
+                settings.stream_timeout
+            APIConnectionError: If the connection fails mid-stream
+        """
+        buf = io.StringIO()
+
+        try:
+            with self.client.messages.stream(
+                timeout=self._stream_timeout, **request
+            ) as stream:
+                for text in stream.text_stream:
+                    buf.write(text)
+                    if on_text is not None:
+                        on_text(text)
+        except httpx2.TimeoutException as e:
+            raise APITimeoutError(request=e.request) from e
+        except httpx2.TransportError as e:
+            # e.g. the connection dropped (RemoteProtocolError, ReadError)
+            raise APIConnectionError(request=e.request) from e
+
+        return buf.getvalue()
+
+    async def _stream_text_async(
+        self,
+        on_text: Callable[[str], None] | None = None,
+        **request: Any,
+    ) -> str:
+        """
+        Async version of _stream_text() using the AsyncAnthropic client.
+
+        Args:
+            on_text: Optional callback, called with each chunk as it arrives
+            **request: Arguments for messages.stream() (model, messages, ...)
+
+        Returns:
+            The complete text of Claude's response
+        """
+        buf = io.StringIO()
+
+        try:
+            async with self.async_client.messages.stream(
+                timeout=self._stream_timeout, **request
+            ) as stream:
+                async for text in stream.text_stream:
+                    buf.write(text)
+                    if on_text is not None:
+                        on_text(text)
+        except httpx2.TimeoutException as e:
+            raise APITimeoutError(request=e.request) from e
+        except httpx2.TransportError as e:
+            raise APIConnectionError(request=e.request) from e
+
+        return buf.getvalue()
+
     def _parse_response(self, response_text: str) -> list[ClarifyingQuestion]:
         """
         Parse Claude's JSON response into structured data.
@@ -215,7 +609,7 @@ class ConversationManager:
         try:
             # Extract JSON from potential markdown formatting
             json_str = self._extract_json(response_text)
-            data = json.loads(json_str)
+            data = json_loads(json_str)
 
             # Check if Claude signaled it has enough information
             if data.get("status") == "ready":
@@ -237,7 +631,7 @@ class ConversationManager:
             self.understanding_summary = data.get("understanding_so_far", "")
 
             # Check if we've hit the question limit
-            if self.questions_asked >= self.settings.max_questions:
+            if self.questions_asked >= self.max_questions:
                 self.is_ready = True
 
             return questions
@@ -266,30 +660,27 @@ class ConversationManager:
         Returns:
             Extracted JSON string
         """
-        # Try to find JSON in ```json ... ``` blocks
-        if "```json" in text:
-            start = text.find("```json") + 7
-            end = text.find("```", start)
-            if end > start:
-                return text[start:end].strip()
-
-        # Try to find JSON in generic ``` ... ``` blocks
-        if "```" in text:
-            start = text.find("```") + 3
-            end = text.find("```", start)
-            if end > start:
-                return text[start:end].strip()
+        # Find the first ```json ... ``` or ``` ... ``` block, if any
+        match = _JSON_FENCE_RE.search(text)
+        if match:
+            return match.group(1).strip()
 
         # Assume the entire response is JSON
         return text.strip()
 
-    def generate_plan(self) -> TaskPlan:
+    def generate_plan(
+        self, on_text: Callable[[str], None] | None = None
+    ) -> TaskPlan:
         """
         Generate the final task plan based on the conversation.
 
         This is called after the Q&A phase is complete. It sends a new
         prompt to Claude asking it to generate a structured plan.
 
+        Args:
+            on_text: Optional callback, called with each chunk of the plan
+                as it streams in (e.g. to show progress)
+
         Returns:
             Complete TaskPlan object
 
@@ -303,54 +694,216 @@ class ConversationManager:
                 "Call start() and answer questions first."
             )
 
-        # Build a summary of the conversation for the prompt
-        conversation_summary = self._build_summary()
-
-        # Create the plan generation prompt
-        prompt = get_plan_generation_prompt(
-            conversation_summary=conversation_summary,
-            original_request=self.original_request
-        )
+        # Already generated by answer_async(speculate=True)?
+        plan_json = self._speculative_plan_json
+        if plan_json is not None:
+            self._speculative_plan_json = None
+            return self._parse_plan(plan_json, self.original_request)
 
         # Make a fresh API call for plan generation
         # (separate from the Q&A conversation)
-        response = self.client.messages.create(
-            model=self.settings.model_name,
-            max_tokens=self.settings.max_tokens,
-            messages=[{"role": "user", "content": prompt}]
+        plan_json = self._stream_text(on_text, **self._plan_request())
+
+        # Parse and validate the plan
+        return self._parse_plan(plan_json, self.original_request)
+
+    async def generate_plan_async(
+        self, on_text: Callable[[str], None] | None = None
+    ) -> TaskPlan:
+        """
+        Async version of generate_plan().
+
+        Args:
+            on_text: Optional callback, called with each chunk of the plan
+                as it streams in (e.g. to show progress)
+
+        Returns:
+            Complete TaskPlan object
+
+        Raises:
+            ConversationError: If conversation isn't ready for plan generation
+        """
+        if not self.is_ready and self.questions_asked < 1:
+            raise ConversationError(
+                "Cannot generate plan: conversation not complete. "
+                "Call start_async() and answer questions first."
+            )
+
+        plan_json = self._speculative_plan_json
+        if plan_json is not None:
+            self._speculative_plan_json = None
+            return self._parse_plan(plan_json, self.original_request)
+
+        plan_json = await self._stream_text_async(on_text, **self._plan_request())
+        return self._parse_plan(plan_json, self.original_request)
+
+    def generate_plans_batch(
+        self,
+        task_descriptions: list[str],
+        poll_interval: float = 10.0,
+        on_poll: Callable[["MessageBatch"], None] | None = None,
+    ) -> list[TaskPlan | ConversationError]:
+        """
+        Generate plans for many tasks with a single Message Batches request.
+
+        No clarifying questions are asked - each plan is generated straight
+        from its task description (like `plan --skip-questions`).
+
+        LEARNING NOTE:
+        The Message Batches API takes many requests in one submission and
+        processes them in the background (at a lower price). Instead of N
+        round trips we make one, then "poll" - check back every few
+        seconds - until the whole batch has finished. Pressing Ctrl+C
+        while we wait cancels the batch on the server.
+
+        Args:
+            task_descriptions: The tasks to plan
+            poll_interval: Seconds to wait between status checks
+            on_poll: Optional callback, called with the batch status after
+                each check (e.g. to show progress)
+
+        Returns:
+            One entry per task, in the same order: the TaskPlan, or a
+            ConversationError if that task failed. Errors are returned
+            rather than raised so one bad task doesn't lose the others.
+        """
+        # Build one plan request per task.
+        # custom_id links each result back to its task.
+        # The prompts are built straight from each task description, so a
+        # conversation in progress on this manager is left untouched.
+        requests: list[batch_create_params.Request] = []
+        for i, task_description in enumerate(task_descriptions):
+            conversation_summary = self._build_summary(
+                [self._opening_message(task_description)]
+            )
+            prompt = get_plan_generation_prompt(
+                conversation_summary=conversation_summary,
+                original_request=task_description,
+            )
+            requests.append({
+                "custom_id": f"task-{i}",
+                "params": self._plan_params(prompt),
+            })
+
+        batch = self.client.messages.batches.create(requests=requests)
+
+        # Wait for the batch to finish
+        try:
+            while batch.processing_status != "ended":
+                if on_poll is not None:
+                    on_poll(batch)
+                time.sleep(poll_interval)
+                batch = self.client.messages.batches.retrieve(batch.id)
+        except KeyboardInterrupt:
+            # Don't leave the batch running (and billed) on the server.
+            # If cancelling fails, still report the Ctrl+C, not that error.
+            with contextlib.suppress(APIError):
+                self.client.messages.batches.cancel(batch.id)
+            raise
+
+        # Results can arrive in any order - match them up by custom_id
+        results: list[TaskPlan | ConversationError] = [
+            ConversationError("No result returned for this task")
+            for _ in task_descriptions
+        ]
+        for entry in self.client.messages.batches.results(batch.id):
+            i = int(entry.custom_id.removeprefix("task-"))
+
+            if entry.result.type == "errored":
+                # Keep the API's explanation (e.g. an invalid request)
+                results[i] = ConversationError(
+                    f"Batch request errored: {entry.result.error.error.message}"
+                )
+                continue
+
+            if entry.result.type != "succeeded":
+                # "canceled" or "expired" - there's no error message
+                results[i] = ConversationError(
+                    f"Batch request {entry.result.type}"
+                )
+                continue
+
+            plan_json = "".join(
+                block.text for block in entry.result.message.content
+                if block.type == "text"
+            )
+            try:
+                results[i] = self._parse_plan(plan_json, task_descriptions[i])
+            except ConversationError as e:
+                results[i] = e
+
+        return results
+
+    def _plan_request(self) -> "MessageCreateParamsNonStreaming":
+        """
+        Build the API request arguments for plan generation.
+
+        Returns:
+            Keyword arguments for messages.stream()
+        """
+        # Build a summary of the conversation for the prompt
+        conversation_summary = self._build_summary(
+            self.messages, self.understanding_summary
         )
 
-        plan_json = response.content[0].text
+        # Create the plan generation prompt
+        # If generate_plan() is retried (e.g. after an API error) with the
+        # same conversation, reuse the prompt we already rendered
+        prompt_key = (conversation_summary, self.original_request)
+        if prompt_key != self._last_plan_prompt_key:
+            self._last_plan_prompt = get_plan_generation_prompt(
+                conversation_summary=conversation_summary,
+                original_request=self.original_request
+            )
+            self._last_plan_prompt_key = prompt_key
+        return self._plan_params(self._last_plan_prompt)
+
+    def _plan_params(self, prompt: str) -> "MessageCreateParamsNonStreaming":
+        """
+        Wrap a plan generation prompt in API request arguments.
 
-        # Parse and validate the plan
-        return self._parse_plan(plan_json)
+        Args:
+            prompt: The rendered plan generation prompt
 
-    def _build_summary(self) -> str:
+        Returns:
+            Keyword arguments for messages.stream() / a batch request
         """
-        Build a human-readable summary of the conversation.
+        return {
+            "model": self.settings.model_name,
+            "max_tokens": self.settings.max_tokens,
+            "messages": [{"role": "user", "content": prompt}],
+        }
+
+    @staticmethod
+    def _build_summary(
+        messages: list[dict[str, str]], understanding_summary: str = ""
+    ) -> str:
+        """
+        Build a human-readable summary of a conversation.
 
         This is included in the plan generation prompt so Claude
         has full context of what was discussed.
 
+        Args:
+            messages: The conversation history
+            understanding_summary: Claude's summary from its "ready" reply
+
         Returns:
             Formatted conversation summary
         """
-        summary_parts = []
-
-        for msg in self.messages:
-            # Label each message with who said it
-            prefix = "User" if msg.role == "user" else "Assistant"
-            summary_parts.append(f"{prefix}: {msg.content}")
+        # Label each message with who said it, joined in a single pass
+        summary = "\n\n".join(
+            f"{'User' if msg['role'] == 'user' else 'Assistant'}: {msg['content']}"
+            for msg in messages
+        )
 
         # Include the understanding summary if we have one
-        if self.understanding_summary:
-            summary_parts.append(
-                f"\nCurrent Understanding: {self.understanding_summary}"
-            )
+        if understanding_summary:
+            summary += f"\n\n\nCurrent Understanding: {understanding_summary}"
 
-        return "\n\n".join(summary_parts)
+        return summary
 
-    def _parse_plan(self, plan_json: str) -> TaskPlan:
+    def _parse_plan(self, plan_json: str, original_request: str) -> TaskPlan:
         """
         Parse Claude's JSON plan response into a TaskPlan object.
 
@@ -361,6 +914,8 @@ class ConversationManager:
 
         Args:
             plan_json: JSON string from Claude
+            original_request: The task description, used if Claude's
+                JSON leaves it out
 
         Returns:
             Validated TaskPlan object
@@ -370,41 +925,42 @@ class ConversationManager:
         """
         try:
             json_str = self._extract_json(plan_json)
-            data = json.loads(json_str)
+            data = json_loads(json_str)
 
-            # Parse each task, handling enum conversion
+            # Collect each task's fields, handling enum conversion
+            # (validation happens once for the whole plan, below)
             tasks = []
             for task_data in data.get("tasks", []):
                 # Convert priority string to enum
                 # .lower() handles if Claude says "High" instead of "high"
+                # If invalid priority, default to medium
                 priority_str = task_data.get("priority", "medium").lower()
-                try:
-                    priority = Priority(priority_str)
-                except ValueError:
-                    # If invalid priority, default to medium
-                    priority = Priority.MEDIUM
-
-                tasks.append(Task(
-                    title=task_data["title"],
-                    description=task_data["description"],
-                    priority=priority,
-                    estimated_hours=task_data.get("estimated_hours"),
-                    dependencies=task_data.get("dependencies", []),
-                    acceptance_criteria=task_data.get("acceptance_criteria", [])
-                ))
+                priority = _PRIORITY_BY_NAME.get(priority_str, Priority.MEDIUM)
 
-            # Create the TaskPlan with all parsed data
-            return TaskPlan(
-                title=data["title"],
-                summary=data["summary"],
-                original_request=data.get("original_request", self.original_request),
-                tasks=tasks,
-                assumptions=data.get("assumptions", []),
-                notes=data.get("notes"),
-                total_estimated_hours=data.get("total_estimated_hours")
-            )
+                tasks.append({
+                    "title": task_data["title"],
+                    "description": task_data["description"],
+                    "priority": priority,
+                    "estimated_hours": task_data.get("estimated_hours"),
+                    "dependencies": task_data.get("dependencies", []),
+                    "acceptance_criteria": task_data.get("acceptance_criteria", []),
+                })
 
-        except (json.JSONDecodeError, KeyError, TypeError) as e:
+            # Create the TaskPlan with all parsed data
+            # LEARNING NOTE:
+            # model_validate() checks the plan AND every nested Task in one
+            # call into pydantic's Rust core, instead of one call per Task.
+            return TaskPlan.model_validate({
+                "title": data["title"],
+                "summary": data["summary"],
+                "original_request": data.get("original_request", original_request),
+                "tasks": tasks,
+                "assumptions": data.get("assumptions", []),
+                "notes": data.get("notes"),
+                "total_estimated_hours": data.get("total_estimated_hours"),
+            })
+
+        except (json.JSONDecodeError, ValidationError, KeyError, TypeError) as e:
             raise ConversationError(
                 f"Failed to parse task plan from Claude's response: {e}"
             )
@@ -9,6 +9,7 @@ LEARNING NOTES:
 
 This module defines the command-line interface:
 - `task-cli plan` - Start interactive task planning
+- `task-cli plan-batch` - Plan many tasks at once (no questions)
 - `task-cli config` - Show current configuration
 - `task-cli version` - Show version information
 
@@ -17,23 +18,32 @@ The CLI orchestrates:
 2. Running the Q&A conversation
 3. Generating the task plan
 4. Formatting and outputting the result
+
+PERFORMANCE NOTE:
+Heavy libraries (anthropic, rich) are imported inside the commands that
+use them, not at the top of this file. Importing anthropic alone takes
+most of a second, and a command like `task-cli version` shouldn't pay
+for it. The same goes for our own config/formatters/storage modules,
+which pull in pydantic. See: python -X importtime -m contextual_task_cli version
 """
 
+from collections.abc import Iterable
 from enum import Enum
-from typing import Annotated, Optional
+from functools import lru_cache
+from typing import TYPE_CHECKING, Annotated, Optional
 
-import anthropic
 import typer
-from rich.console import Console
-from rich.markdown import Markdown
-from rich.panel import Panel
-from rich.prompt import Prompt
 
 from . import __version__
-from .config import get_settings
-from .conversation import ConversationError, ConversationManager
-from .formatters import format_as_json, format_as_markdown
-from .storage import save_plan, load_plan, list_plans
+
+if TYPE_CHECKING:
+    # Only imported for type hints - never at runtime
+    import asyncio
+
+    from anthropic.types.messages import MessageBatch
+    from rich.console import Console
+
+    from .conversation import ConversationManager
 
 
 # ============================================================================
@@ -43,7 +53,7 @@ from .storage import save_plan, load_plan, list_plans
 # Good error handling transforms cryptic errors into actionable messages.
 # We catch specific exception types and provide helpful guidance.
 
-def handle_api_error(error: Exception, console: Console) -> None:
+def handle_api_error(error: Exception, console: "Console") -> None:
     """
     Handle Anthropic API errors with user-friendly messages.
 
@@ -55,6 +65,9 @@ def handle_api_error(error: Exception, console: Console) -> None:
         error: The exception that was raised
         console: Rich console for formatted output
     """
+    import anthropic
+    from rich.panel import Panel
+
     if isinstance(error, anthropic.AuthenticationError):
         console.print(Panel(
             "[red bold]Authentication Error[/red bold]\n\n"
@@ -95,6 +108,17 @@ def handle_api_error(error: Exception, console: Console) -> None:
                 border_style="red"
             ))
 
+    elif isinstance(error, anthropic.APITimeoutError):
+        # Must come before APIConnectionError (it's a subclass)
+        console.print(Panel(
+            "[red bold]Request Timed Out[/red bold]\n\n"
+            "Claude stopped responding partway through.\n\n"
+            "[dim]To fix:[/dim]\n"
+            "1. Try again in a few moments\n"
+            "2. On a slow connection, raise TASK_CLI_STREAM_TIMEOUT in your .env file",
+            border_style="red"
+        ))
+
     elif isinstance(error, anthropic.APIConnectionError):
         console.print(Panel(
             "[red bold]Connection Error[/red bold]\n\n"
@@ -131,9 +155,50 @@ app = typer.Typer(
     no_args_is_help=True,  # Show help if no command is given
 )
 
-# Rich console for beautiful terminal output
-# All output goes through this for consistent formatting
-console = Console()
+
+@lru_cache(maxsize=1)
+def get_console() -> "Console":
+    """
+    Get the Rich console used for all terminal output (created on first use).
+
+    All output goes through this for consistent formatting. Like
+    get_settings(), the console is cached so every command shares it.
+    """
+    from rich.console import Console
+
+    return Console()
+
+
+def print_markdown(console: "Console", chunks: Iterable[str]) -> None:
+    """
+    Print Markdown chunks (e.g. from format_as_markdown_stream()).
+
+    LEARNING NOTE:
+    Rich parses Markdown into a tree of renderables before printing it.
+    Rendering one chunk (section or task) at a time keeps that tree
+    small, even for plans with many tasks. The blank line we print
+    between chunks is the one Rich would put between sections anyway,
+    so the output looks exactly like rendering the whole document.
+
+    When output isn't a terminal (piped to a file or another program),
+    styling would be lost anyway - so we skip Rich's Markdown rendering
+    and write the Markdown source as-is.
+
+    Args:
+        console: Rich console to print to
+        chunks: Consecutive pieces of a Markdown document
+    """
+    if not console.is_terminal:
+        for chunk in chunks:
+            console.out(chunk, highlight=False, end="")
+        return
+
+    from rich.markdown import Markdown
+
+    for i, chunk in enumerate(chunks):
+        if i:
+            console.line()
+        console.print(Markdown(chunk))
 
 
 # ============================================================================
@@ -184,14 +249,15 @@ def plan(
     ] = None,
 
     max_questions: Annotated[
-        int,
+        Optional[int],
         typer.Option(
             "--max-questions", "-q",
-            help="Maximum clarifying questions to ask.",
+            help="Maximum clarifying questions to ask. "
+                 "Defaults to TASK_CLI_MAX_QUESTIONS (5).",
             min=1,
             max=10
         )
-    ] = 5,
+    ] = None,
 
     skip_questions: Annotated[
         bool,
@@ -208,6 +274,16 @@ def plan(
             help="Save the plan to ~/.task-cli/plans/ after generating."
         )
     ] = False,
+
+    speculate: Annotated[
+        bool,
+        typer.Option(
+            "--speculate",
+            help="Start generating the plan while Claude reviews each answer. "
+                 "Faster when Claude is ready, but uses more API tokens, and "
+                 "the plan won't see Claude's final summary of the task."
+        )
+    ] = False,
 ) -> None:
     """
     Create a structured task plan through an AI-powered conversation.
@@ -229,11 +305,24 @@ def plan(
         # Skip questions for simple tasks
         task-cli plan -s "Write unit tests for login"
     """
+    import asyncio
+
+    import anthropic
+    from rich.panel import Panel
+    from rich.prompt import Prompt
+
+    from .config import get_settings
+    from .conversation import ConversationError, ConversationManager
+    from .formatters import format_as_json, format_as_markdown_stream
+    from .storage import save_plan
+
+    console = get_console()
+
     # -------------------------------------------------------------------------
     # Step 1: Validate Configuration
     # -------------------------------------------------------------------------
     try:
-        settings = get_settings()
+        get_settings()
     except Exception as e:
         console.print(
             f"[red bold]Configuration Error:[/red bold] {e}\n\n"
@@ -265,16 +354,12 @@ def plan(
     # Step 3: Initialize Conversation
     # -------------------------------------------------------------------------
     try:
-        manager = ConversationManager()
+        # --max-questions overrides the setting (None keeps the setting)
+        manager = ConversationManager(max_questions=max_questions)
     except Exception as e:
         console.print(f"[red]Failed to initialize:[/red] {e}")
         raise typer.Exit(1)
 
-    # Override max questions if user specified a different value
-    if max_questions != settings.max_questions:
-        manager.settings = get_settings()
-        # Note: In a more robust implementation, we'd pass this as a parameter
-
     console.print(f"\n[dim]Planning task:[/dim] {task}\n")
 
     # -------------------------------------------------------------------------
@@ -283,16 +368,25 @@ def plan(
     # LEARNING NOTE:
     # We wrap API calls in try/except to catch and handle errors gracefully.
     # This prevents ugly tracebacks and gives users actionable feedback.
+    #
+    # With --speculate, answers go through answer_async() so the plan can
+    # be generated in parallel with Claude's reply. We keep one event loop
+    # for the whole Q&A: async HTTP connections belong to the loop that
+    # opened them, so a new asyncio.run() per answer couldn't reuse them.
+    loop = asyncio.new_event_loop() if speculate else None
 
     try:
         if skip_questions:
             # Quick mode: go straight to plan generation
             console.print("[yellow]Skipping questions, generating plan directly...[/yellow]\n")
-            manager.start(task)
+            with console.status("[dim]Thinking...[/dim]"):
+                manager.start(task)
             manager.is_ready = True
         else:
             # Interactive mode: conduct the Q&A conversation
-            questions = manager.start(task)
+            # A spinner shows we're waiting on Claude, not frozen
+            with console.status("[dim]Thinking...[/dim]"):
+                questions = manager.start(task)
 
             # Loop until Claude is ready (no more questions)
             while questions and not manager.is_ready:
@@ -317,7 +411,13 @@ def plan(
                     answer = Prompt.ask("\n[bold]Your answer[/bold]")
 
                     # Send to Claude and get next questions
-                    questions = manager.answer(answer)
+                    with console.status("[dim]Thinking...[/dim]"):
+                        if loop is not None:
+                            questions = loop.run_until_complete(
+                                manager.answer_async(answer, speculate=True)
+                            )
+                        else:
+                            questions = manager.answer(answer)
 
             console.print("\n[green]Great! Generating your task plan...[/green]\n")
 
@@ -331,11 +431,30 @@ def plan(
         console.print("\n[yellow]Cancelled by user.[/yellow]")
         raise typer.Exit(130)  # Standard exit code for SIGINT
 
+    finally:
+        if loop is not None:
+            _close_event_loop(loop, manager)
+
     # -------------------------------------------------------------------------
     # Step 5: Generate the Plan
     # -------------------------------------------------------------------------
+    # LEARNING NOTE:
+    # The plan streams in chunk by chunk. on_text is called for each chunk,
+    # so we can update the spinner with how much has arrived - long plans
+    # show steady progress instead of a silent wait.
     try:
-        task_plan = manager.generate_plan()
+        with console.status("[green]Generating your task plan...[/green]") as status:
+            received = 0
+
+            def show_progress(text: str) -> None:
+                nonlocal received
+                received += len(text)
+                status.update(
+                    "[green]Generating your task plan...[/green] "
+                    f"[dim]({received:,} characters received)[/dim]"
+                )
+
+            task_plan = manager.generate_plan(on_text=show_progress)
 
     except (anthropic.APIError, anthropic.APIConnectionError) as e:
         handle_api_error(e, console)
@@ -352,10 +471,21 @@ def plan(
     # -------------------------------------------------------------------------
     # Step 6: Format Output
     # -------------------------------------------------------------------------
+    # LEARNING NOTE:
+    # Markdown comes from a generator, one section at a time. When writing
+    # to a file, each chunk goes straight to disk and the full document is
+    # never held in memory.
+    #
+    # Any output we produce here is kept and handed to save_plan() in
+    # Step 8, so the plan isn't formatted twice.
+    json_text: str | None = None
+    md_sections: list[str] | None = None
+
     if output_format == OutputFormat.JSON:
-        output = format_as_json(task_plan)
+        json_text = format_as_json(task_plan)
+        chunks: Iterable[str] = [json_text]
     else:
-        output = format_as_markdown(task_plan)
+        chunks = format_as_markdown_stream(task_plan)
 
     # -------------------------------------------------------------------------
     # Step 7: Write or Display Output
@@ -363,16 +493,19 @@ def plan(
     if output_file:
         # Write to file
         with open(output_file, "w", encoding="utf-8") as f:
-            f.write(output)
+            f.writelines(chunks)
         console.print(f"[green]Plan saved to:[/green] {output_file}")
     else:
         # Display in terminal
         if output_format == OutputFormat.MARKDOWN:
+            # Keep the chunks: we render them one at a time, and Step 8
+            # joins them only if the plan is saved
+            md_sections = list(chunks)
             # Rich can render Markdown beautifully in the terminal
-            console.print(Markdown(output))
+            print_markdown(console, md_sections)
         else:
             # JSON is already formatted, print as-is
-            console.print(output)
+            console.print(json_text)
 
     # -------------------------------------------------------------------------
     # Step 8: Save Plan (if requested)
@@ -391,7 +524,8 @@ def plan(
 
     if should_save:
         try:
-            saved_path = save_plan(task_plan)
+            md_text = "".join(md_sections) if md_sections is not None else None
+            saved_path = save_plan(task_plan, json_text=json_text, md_text=md_text)
             console.print(f"\n[green]Plan saved![/green]")
             console.print(f"  JSON: {saved_path}.json")
             console.print(f"  Markdown: {saved_path}.md")
@@ -399,6 +533,120 @@ def plan(
             console.print(f"[red]Failed to save plan:[/red] {e}")
 
 
+def _close_event_loop(
+    loop: "asyncio.AbstractEventLoop", manager: "ConversationManager"
+) -> None:
+    """
+    Cancel anything still running on an event loop, then close it.
+
+    After Ctrl+C, a speculative plan request may still be pending.
+    Cancelling it first avoids "Task was destroyed but it is pending!"
+    warnings when the loop closes. The manager's async client is closed
+    on the loop too, so its connections aren't left bound to a dead loop.
+    """
+    import asyncio
+
+    pending = asyncio.all_tasks(loop)
+    if pending:
+        for task in pending:
+            task.cancel()
+        loop.run_until_complete(
+            asyncio.gather(*pending, return_exceptions=True)
+        )
+    loop.run_until_complete(manager.aclose())
+    loop.close()
+
+
+# ============================================================================
+# Batch Command: plan-batch
+# ============================================================================
+
+@app.command(name="plan-batch")
+def plan_batch(
+    tasks_file: Annotated[
+        str,
+        typer.Argument(help="Text file with one task description per line.")
+    ],
+) -> None:
+    """
+    Generate plans for many tasks at once and save them to ~/.task-cli/plans/.
+
+    No clarifying questions are asked. All tasks are sent to Claude as a
+    single batch request, which can take a few minutes to process.
+
+    \b
+    Examples:
+        task-cli plan-batch tasks.txt
+    """
+    import anthropic
+
+    from .conversation import ConversationError, ConversationManager
+    from .storage import save_plan
+
+    console = get_console()
+
+    # Read the tasks, skipping blank lines
+    try:
+        with open(tasks_file, encoding="utf-8") as f:
+            tasks = [line.strip() for line in f if line.strip()]
+    except OSError as e:
+        console.print(f"[red]Could not read tasks file:[/red] {e}")
+        raise typer.Exit(1)
+
+    if not tasks:
+        console.print(f"[red]Error:[/red] No tasks found in {tasks_file}.")
+        raise typer.Exit(1)
+
+    try:
+        manager = ConversationManager()
+    except Exception as e:
+        console.print(f"[red]Failed to initialize:[/red] {e}")
+        raise typer.Exit(1)
+
+    # Submit the batch and wait for it, showing progress while we poll
+    try:
+        with console.status(f"[green]Planning {len(tasks)} tasks...[/green]") as status:
+
+            def show_progress(batch: "MessageBatch") -> None:
+                done = len(tasks) - batch.request_counts.processing
+                status.update(
+                    f"[green]Planning {len(tasks)} tasks...[/green] "
+                    f"[dim]({done}/{len(tasks)} done)[/dim]"
+                )
+
+            results = manager.generate_plans_batch(tasks, on_poll=show_progress)
+
+    except (anthropic.APIError, anthropic.APIConnectionError) as e:
+        handle_api_error(e, console)
+        raise typer.Exit(1)
+
+    except KeyboardInterrupt:
+        console.print("\n[yellow]Cancelled by user.[/yellow]")
+        raise typer.Exit(130)
+
+    # Save each plan (or report why it failed)
+    failures = 0
+    for task, result in zip(tasks, results):
+        if isinstance(result, ConversationError):
+            failures += 1
+            console.print(f"[red]Failed:[/red] {task}\n  [dim]{result}[/dim]")
+            continue
+
+        try:
+            # Two tasks can produce plans with the same title - give each
+            # its own file instead of letting the second replace the first
+            saved_path = save_plan(result, overwrite=False)
+            console.print(f"[green]Saved:[/green] {result.title}")
+            console.print(f"  [dim]{saved_path}.json[/dim]")
+        except Exception as e:
+            failures += 1
+            console.print(f"[red]Failed to save plan:[/red] {e}")
+
+    console.print(f"\n{len(tasks) - failures} of {len(tasks)} plans saved.")
+    if failures:
+        raise typer.Exit(1)
+
+
 # ============================================================================
 # Utility Commands
 # ============================================================================
@@ -406,12 +654,19 @@ def plan(
 @app.command()
 def config() -> None:
     """Show current configuration (API key is masked)."""
+    from rich.panel import Panel
+
+    from .config import get_settings
+
+    console = get_console()
     try:
         settings = get_settings()
         console.print(Panel(
             f"[bold]Model:[/bold] {settings.model_name}\n"
             f"[bold]Max Tokens:[/bold] {settings.max_tokens}\n"
             f"[bold]Max Questions:[/bold] {settings.max_questions}\n"
+            f"[bold]Max Retries:[/bold] {settings.max_retries}\n"
+            f"[bold]Stream Timeout:[/bold] {settings.stream_timeout}s\n"
             f"[bold]API Key:[/bold] {'*' * 20}... [green](set)[/green]",
             title="Current Configuration",
             border_style="green"
@@ -424,7 +679,8 @@ def config() -> None:
 @app.command()
 def version() -> None:
     """Show version information."""
-    console.print(f"[bold]task-cli[/bold] version {__version__}")
+    # Plain typer.echo so this command doesn't need to import Rich at all
+    typer.echo(f"task-cli version {__version__}")
 
 
 # ============================================================================
@@ -439,6 +695,9 @@ def list_saved_plans() -> None:
     """List all saved plans in ~/.task-cli/plans/"""
     from rich.table import Table
 
+    from .storage import list_plans
+
+    console = get_console()
     plans = list_plans()
 
     if not plans:
@@ -473,6 +732,10 @@ def load(
     ] = OutputFormat.MARKDOWN,
 ) -> None:
     """Load and display a saved plan."""
+    from .formatters import format_as_json, format_as_markdown_stream
+    from .storage import load_plan
+
+    console = get_console()
     try:
         task_plan = load_plan(filename)
 
@@ -480,7 +743,7 @@ def load(
         if output_format == OutputFormat.JSON:
             console.print(format_as_json(task_plan))
         else:
-            console.print(Markdown(format_as_markdown(task_plan)))
+            print_markdown(console, format_as_markdown_stream(task_plan))
 
     except FileNotFoundError:
         console.print(f"[red]Plan not found:[/red] {filename}")
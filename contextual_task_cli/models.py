@@ -16,7 +16,7 @@ These models define the schema for:
 from datetime import datetime
 from enum import Enum
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_serializer
 
 
 class Priority(str, Enum):
@@ -148,6 +148,20 @@ class TaskPlan(BaseModel):
         description="When the plan was generated"
     )
 
+    @field_serializer("created_at", when_used="json")
+    def _serialize_created_at(self, created_at: datetime) -> str:
+        """
+        Write created_at with whole seconds (e.g. "2026-01-07T14:30:05").
+
+        LEARNING NOTE:
+        JSON output is deterministic: fields always come out in the order
+        they're declared above, so the same plan always produces the same
+        text. Dropping microseconds keeps timestamps at a fixed length
+        too. Identical text matters if a saved plan is ever sent back to
+        Claude - prompt caching only reuses an exact prefix match.
+        """
+        return created_at.isoformat(timespec="seconds")
+
     def calculate_total_hours(self) -> float | None:
         """
         Calculate total hours from individual task estimates.
@@ -164,8 +178,13 @@ class ConversationMessage(BaseModel):
     """
     Represents a single message in the conversation history.
 
-    Used internally to track the back-and-forth with Claude.
     The role is either "user" or "assistant" (Claude).
+
+    LEARNING NOTE:
+    ConversationManager stores its history as plain dicts in the format
+    the Anthropic API expects, so no model validation runs per message.
+    Use ConversationMessage.model_validate(msg) when you need a typed
+    view of an entry from manager.messages.
     """
 
     role: str = Field(
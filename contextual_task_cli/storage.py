@@ -11,13 +11,37 @@ Single Responsibility: This file ONLY deals with persistence (saving/loading).
 """
 
 import json
+import os
+from collections.abc import Callable
 from datetime import date
+from functools import lru_cache
 from pathlib import Path
+from typing import Any
 
 from .formatters import format_as_json, format_as_markdown
 from .models import TaskPlan
 
+# orjson parses JSON several times faster than the standard library.
+# It's optional (pip install -e ".[fast]"); both accept bytes and raise
+# json.JSONDecodeError subclasses, so they're interchangeable here.
+# (Declaring the shared signature first lets type checkers accept both.)
+json_loads: Callable[[str | bytes], Any]
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
 
+# Translation table for filename slugs: spaces become dashes, and
+# characters that are problematic in filenames are removed.
+# str.translate() applies the whole table in a single pass over the string.
+_SLUG_TABLE = str.maketrans(" ", "-", '/\\:*?"<>|')
+
+# Index of saved plans: {filename: {"title": ..., "created_at": ...}}
+# Lets list_plans() read one file instead of opening every plan.
+_INDEX_FILENAME = "index.json"
+
+
+@lru_cache(maxsize=1)
 def get_plans_directory() -> Path:
     """
     Get the path to ~/.task-cli/plans/, creating it if needed.
@@ -26,6 +50,9 @@ def get_plans_directory() -> Path:
     - Standard Unix convention for app data
     - Survives project deletions
     - Single location for all plans
+
+    Cached like get_settings(): the directory is created on the first
+    call, and later calls return the same Path without touching the disk.
     """
     plans_dir = Path.home() / ".task-cli" / "plans"
     plans_dir.mkdir(parents=True, exist_ok=True)
@@ -43,14 +70,17 @@ def generate_filename(plan: TaskPlan) -> str:
     """
     today = date.today().isoformat()
     # Convert title to URL-friendly slug
-    slug = plan.title.lower().replace(" ", "-")
-    # Remove characters that are problematic in filenames
-    for char in ['/', '\\', ':', '*', '?', '"', '<', '>', '|']:
-        slug = slug.replace(char, '')
+    slug = plan.title.lower().translate(_SLUG_TABLE)
     return f"{today}_{slug}"
 
 
-def save_plan(plan: TaskPlan) -> Path:
+def save_plan(
+    plan: TaskPlan,
+    *,
+    json_text: str | None = None,
+    md_text: str | None = None,
+    overwrite: bool = True,
+) -> Path:
     """
     Save a plan as both JSON and Markdown.
 
@@ -59,45 +89,156 @@ def save_plan(plan: TaskPlan) -> Path:
     Why both formats?
     - JSON: machine-readable, can be loaded back into Python
     - Markdown: human-readable, can open in any editor
+
+    Args:
+        plan: The TaskPlan to save
+        json_text: The plan already formatted by format_as_json(), if the
+                   caller has it - saves formatting the plan a second time
+        md_text: The plan already formatted by format_as_markdown(), if
+                 the caller has it
+        overwrite: If False and a plan with the same filename exists
+                   (same title, same day), save under a new name like
+                   '2026-01-07_my-plan-2' instead of replacing it
     """
     plans_dir = get_plans_directory()
     filename = generate_filename(plan)
+    if not overwrite:
+        filename = _unused_filename(plans_dir, filename)
+
+    # LEARNING NOTE:
+    # We encode to UTF-8 ourselves and write bytes. write_text() would
+    # encode with the platform's default encoding (not UTF-8 on Windows),
+    # which breaks plans containing non-ASCII text like "café" or emoji.
 
     # Save JSON (source of truth)
     json_path = plans_dir / f"{filename}.json"
-    json_path.write_text(format_as_json(plan))
+    if json_text is None:
+        json_text = format_as_json(plan)
+    json_path.write_bytes(json_text.encode("utf-8"))
 
     # Save Markdown (human-readable copy)
     md_path = plans_dir / f"{filename}.md"
-    md_path.write_text(format_as_markdown(plan))
+    if md_text is None:
+        md_text = format_as_markdown(plan)
+    md_path.write_bytes(md_text.encode("utf-8"))
+
+    # Record the plan in the index used by list_plans()
+    index = _read_index(plans_dir)
+    index[filename] = plan.model_dump(mode="json", include={"title", "created_at"})
+    _write_index(plans_dir, index)
 
     return plans_dir / filename  # Return base path
 
 
+def _unused_filename(plans_dir: Path, filename: str) -> str:
+    """
+    Return filename, or filename-2, filename-3, ... - the first one that
+    no saved plan uses yet.
+    """
+    candidate = filename
+    suffix = 2
+    while (plans_dir / f"{candidate}.json").exists():
+        candidate = f"{filename}-{suffix}"
+        suffix += 1
+    return candidate
+
+
 def list_plans() -> list[dict]:
     """
     List all saved plans with their metadata.
 
     Returns list of dicts with 'filename', 'title', 'created' for display.
     Only looks at .json files (source of truth).
+
+    PERFORMANCE NOTE:
+    Titles and dates come from the index file, so we don't open and parse
+    every plan. Listing the directory is still needed (it's cheap - no
+    files are opened) to keep the index in sync: plans deleted by hand
+    are dropped, and plans copied in by hand are read once and added.
     """
     plans_dir = get_plans_directory()
-    plans = []
+    index = _read_index(plans_dir)
+
+    # filename without extension, for every plan on disk
+    on_disk = {
+        json_file.stem for json_file in plans_dir.glob("*.json")
+        if json_file.name != _INDEX_FILENAME
+    }
+
+    # Sync the index with what's actually on disk
+    changed = False
+    for filename in index.keys() - on_disk:
+        del index[filename]
+        changed = True
 
-    for json_file in sorted(plans_dir.glob("*.json"), reverse=True):
+    for filename in on_disk - index.keys():
         try:
-            data = json.loads(json_file.read_text())
-            plans.append({
-                "filename": json_file.stem,  # filename without extension
+            data = json_loads((plans_dir / f"{filename}.json").read_bytes())
+            entry = {
                 "title": data.get("title", "Unknown"),
-                "created": data.get("created_at", "Unknown"),
-                "path": json_file,
-            })
-        except (json.JSONDecodeError, KeyError):
+                "created_at": data.get("created_at", "Unknown"),
+            }
+        except (json.JSONDecodeError, AttributeError):
             # Skip corrupted files
             continue
+        if _is_index_entry(entry):
+            index[filename] = entry
+            changed = True
 
-    return plans
+    if changed:
+        _write_index(plans_dir, index)
+
+    return [
+        {
+            "filename": filename,
+            "title": index[filename]["title"],
+            "created": index[filename]["created_at"],
+            "path": plans_dir / f"{filename}.json",
+        }
+        for filename in sorted(index, reverse=True)
+    ]
+
+
+def _read_index(plans_dir: Path) -> dict[str, dict[str, str]]:
+    """
+    Read the plan index, or return an empty one if it's missing/corrupted.
+
+    Entries that don't look like {"title": str, "created_at": str} are
+    dropped too. A missing entry isn't a problem: list_plans() re-reads
+    that plan from disk and adds it back.
+    """
+    try:
+        index = json_loads((plans_dir / _INDEX_FILENAME).read_bytes())
+    except (OSError, json.JSONDecodeError):
+        return {}
+    if not isinstance(index, dict):
+        return {}
+    return {
+        filename: entry for filename, entry in index.items()
+        if _is_index_entry(entry)
+    }
+
+
+def _is_index_entry(entry: object) -> bool:
+    """Check that an index entry has a string title and created_at."""
+    return (
+        isinstance(entry, dict)
+        and isinstance(entry.get("title"), str)
+        and isinstance(entry.get("created_at"), str)
+    )
+
+
+def _write_index(plans_dir: Path, index: dict[str, dict[str, str]]) -> None:
+    """
+    Write the plan index atomically.
+
+    We write to a temporary file, then os.replace() it over the real one.
+    The replace is atomic, so a crash mid-write can never leave a
+    half-written index behind.
+    """
+    tmp_path = plans_dir / f"{_INDEX_FILENAME}.tmp"
+    tmp_path.write_bytes(json.dumps(index, ensure_ascii=False).encode("utf-8"))
+    os.replace(tmp_path, plans_dir / _INDEX_FILENAME)
 
 
 def load_plan(filename: str) -> TaskPlan:
@@ -109,6 +250,12 @@ def load_plan(filename: str) -> TaskPlan:
                   or full path to .json file
 
     This is why we save as JSON - Pydantic can reconstruct the full object!
+
+    PERFORMANCE NOTE:
+    Parsing uses orjson when installed. Validation stays on
+    model_validate() even though we wrote the file ourselves: pydantic's
+    validator runs in Rust, and rebuilding the nested Tasks, enums and
+    datetime by hand with model_construct() measured ~3x slower.
     """
     plans_dir = get_plans_directory()
 
@@ -118,8 +265,9 @@ def load_plan(filename: str) -> TaskPlan:
 
     json_path = plans_dir / filename
 
-    if not json_path.exists():
+    # index.json lives next to the plans but isn't one
+    if filename == _INDEX_FILENAME or not json_path.exists():
         raise FileNotFoundError(f"Plan not found: {json_path}")
 
-    data = json.loads(json_path.read_text())
+    data = json_loads(json_path.read_bytes())
     return TaskPlan.model_validate(data)  # Pydantic reconstructs the object!
@@ -0,0 +1,193 @@
+"""
+Tests for how ConversationManager handles a broken response stream.
+
+LEARNING NOTES:
+- httpx2.MockTransport answers requests in-process, so no network is used
+- The response body is a generator: it sends one event, then raises the
+  error a real connection would, partway through the stream
+- The CLI only catches Anthropic's exception types, so errors from the
+  HTTP library must never escape ConversationManager
+"""
+
+import asyncio
+from collections.abc import AsyncIterator, Iterator
+
+import httpx2
+import pytest
+from anthropic import Anthropic, APIConnectionError, APITimeoutError, AsyncAnthropic
+
+from contextual_task_cli.config import reset_settings
+from contextual_task_cli.conversation import ConversationManager
+
+# A keep-alive event, so the error happens mid-stream rather than on connect
+_FIRST_EVENT = b'event: ping\ndata: {"type": "ping"}\n\n'
+
+
+class _FailingStream(httpx2.SyncByteStream):
+    """Response body that sends one event, then fails with `error`."""
+
+    def __init__(self, error: Exception) -> None:
+        self.error = error
+
+    def __iter__(self) -> Iterator[bytes]:
+        yield _FIRST_EVENT
+        raise self.error
+
+
+class _AsyncFailingStream(httpx2.AsyncByteStream):
+    """Async version of _FailingStream."""
+
+    def __init__(self, error: Exception) -> None:
+        self.error = error
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        yield _FIRST_EVENT
+        raise self.error
+
+
+def _stream_response(
+    request: httpx2.Request,
+    stream: httpx2.SyncByteStream | httpx2.AsyncByteStream,
+) -> httpx2.Response:
+    return httpx2.Response(
+        200,
+        headers={"content-type": "text/event-stream"},
+        stream=stream,
+        request=request,
+    )
+
+
+@pytest.fixture
+def manager(monkeypatch: pytest.MonkeyPatch) -> Iterator[ConversationManager]:
+    """A ConversationManager with a dummy API key."""
+    monkeypatch.setenv("TASK_CLI_ANTHROPIC_API_KEY", "test-key")
+    reset_settings()
+    yield ConversationManager()
+    reset_settings()
+
+
+def _use_failing_stream(
+    manager: ConversationManager, error_type: type[httpx2.TransportError]
+) -> None:
+    """Point both of the manager's clients at a stream that fails."""
+
+    def sync_handler(request: httpx2.Request) -> httpx2.Response:
+        return _stream_response(
+            request, _FailingStream(error_type("stream failed", request=request))
+        )
+
+    async def async_handler(request: httpx2.Request) -> httpx2.Response:
+        return _stream_response(
+            request,
+            _AsyncFailingStream(error_type("stream failed", request=request)),
+        )
+
+    manager.client = Anthropic(
+        api_key="test-key",
+        max_retries=0,
+        http_client=httpx2.Client(transport=httpx2.MockTransport(sync_handler)),
+    )
+    manager.async_client = AsyncAnthropic(
+        api_key="test-key",
+        max_retries=0,
+        http_client=httpx2.AsyncClient(
+            transport=httpx2.MockTransport(async_handler)
+        ),
+    )
+
+
+def test_stalled_stream_raises_api_timeout_error(
+    manager: ConversationManager,
+) -> None:
+    _use_failing_stream(manager, httpx2.ReadTimeout)
+
+    with pytest.raises(APITimeoutError):
+        manager.start("Build a REST API")
+
+
+def test_stalled_async_stream_raises_api_timeout_error(
+    manager: ConversationManager,
+) -> None:
+    _use_failing_stream(manager, httpx2.ReadTimeout)
+
+    with pytest.raises(APITimeoutError):
+        asyncio.run(manager.start_async("Build a REST API"))
+
+
+@pytest.mark.parametrize(
+    "error_type", [httpx2.RemoteProtocolError, httpx2.ReadError]
+)
+def test_dropped_stream_raises_api_connection_error(
+    manager: ConversationManager, error_type: type[httpx2.TransportError]
+) -> None:
+    _use_failing_stream(manager, error_type)
+
+    with pytest.raises(APIConnectionError) as exc_info:
+        manager.start("Build a REST API")
+    assert not isinstance(exc_info.value, APITimeoutError)
+
+
+@pytest.mark.parametrize(
+    "error_type", [httpx2.RemoteProtocolError, httpx2.ReadError]
+)
+def test_dropped_async_stream_raises_api_connection_error(
+    manager: ConversationManager, error_type: type[httpx2.TransportError]
+) -> None:
+    _use_failing_stream(manager, error_type)
+
+    with pytest.raises(APIConnectionError) as exc_info:
+        asyncio.run(manager.start_async("Build a REST API"))
+    assert not isinstance(exc_info.value, APITimeoutError)
+
+
+# ============================================================================
+# Speculative plan generation (answer_async(speculate=True))
+# ============================================================================
+
+_QUESTIONS = '{"status": "questioning", "questions": [{"question": "When?"}]}'
+_READY = '{"status": "ready", "summary": "Clear enough"}'
+
+
+def _speculate_with_failing_plan(
+    manager: ConversationManager, reply: str
+) -> list[object]:
+    """
+    Run one speculative answer where Claude replies with `reply` and the
+    speculative plan request fails with an unexpected error.
+    """
+
+    replies = [_QUESTIONS, reply]  # start_async(), then answer_async()
+
+    async def fake_stream(on_text: object = None, **request: object) -> str:
+        if "system" in request:  # Q&A turn (plan requests have no system)
+            await asyncio.sleep(0.01)  # Let the plan request fail first
+            return replies.pop(0)
+        raise RuntimeError("speculative plan failed")
+
+    manager._stream_text_async = fake_stream  # type: ignore[method-assign]
+
+    async def run() -> list[object]:
+        await manager.start_async("Build a REST API")
+        return list(await manager.answer_async("Next week", speculate=True))
+
+    manager.max_questions = 5
+    return asyncio.run(run())
+
+
+def test_failed_speculative_plan_falls_back_when_ready(
+    manager: ConversationManager,
+) -> None:
+    questions = _speculate_with_failing_plan(manager, _READY)
+
+    assert questions == []
+    assert manager.is_ready
+    assert manager._speculative_plan_json is None
+
+
+def test_failed_speculative_plan_is_discarded_on_more_questions(
+    manager: ConversationManager,
+) -> None:
+    questions = _speculate_with_failing_plan(manager, _QUESTIONS)
+
+    assert len(questions) == 1
+    assert not manager.is_ready